@@ -1,8 +1,13 @@
+import warnings
+
 from adalflow.components.agent.agent import Agent
 from adalflow.components.agent.runner import Runner
 from adalflow.core.model_client import ModelClient
 from adalflow.core.func_tool import FunctionTool
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+_EXAMPLE_PREFIX = "Processed: "
 
 
 def example_tool(query: str) -> str:
@@ -14,7 +19,7 @@ def example_tool(query: str) -> str:
     Returns:
         A simple response
     """
-    return f"Processed: {query}"
+    return _EXAMPLE_PREFIX + str(query)
 
 
 class DummyAgent:
@@ -24,6 +29,8 @@ class DummyAgent:
     Agent (for planning/decision-making) and Runner (for execution) components.
     """
     
+    __slots__ = ("agent", "runner")
+    
     def __init__(
         self,
         model_client: ModelClient,
@@ -40,20 +47,21 @@ class DummyAgent:
             model_kwargs: Additional model configuration
             tools: List of tools available to the agent
             max_steps: Maximum number of steps for the agent
+            **kwargs: Extra Agent arguments. A custom planner only sees tools
+                registered later if its template reads prompt_kwargs["tools"].
         """
         
         # Prepare tools
         if tools is None:
-            # Create a default tool as an example
-            example_func_tool = FunctionTool(
-                fn=example_tool,
-            )
-            tools = [example_func_tool]
+            # Create a default tool as an example. FunctionTool is a Component
+            # adopted by the agent's ToolManager, so each agent gets its own.
+            tools = (FunctionTool(fn=example_tool),)
         
-        # Initialize the Agent component for planning and decision-making
+        # Initialize the Agent component for planning and decision-making.
+        # Agent copies its tools with list.copy(), so hand it a list.
         self.agent = Agent(
             name="DummyAgent",
-            tools=tools,
+            tools=list(tools),
             model_client=model_client,
             model_kwargs=model_kwargs or {},
             max_steps=max_steps,
@@ -63,6 +71,11 @@ class DummyAgent:
         # Initialize the Runner component for execution
         self.runner = Runner(agent=self.agent, max_steps=max_steps)
     
+    @property
+    def tools(self) -> Tuple[FunctionTool, ...]:
+        """The tools registered with the agent's ToolManager."""
+        return tuple(self.agent.tool_manager.tools)
+    
     def call(self, query: str, context: Optional[Dict[str, Any]] = None) -> Any:
         """
         Execute the agent with a query using the Runner.
@@ -107,7 +120,55 @@ class DummyAgent:
         Args:
             tool: The tool to add
         """
-        self.agent.tools.append(tool)
+        self.register_tools((tool,))
+    
+    def register_tools(self, tools: Iterable[Any]) -> None:
+        """
+        Add several tools to the agent in a single update.
+        
+        The tools are appended to the agent's existing ToolManager and the tool
+        definitions are refreshed once for the whole batch, so the Agent and
+        Runner keep any configuration set on them after construction. Tools
+        whose name is already registered are skipped with a warning.
+        
+        Args:
+            tools: The tools to add
+        """
+        tool_manager = self.agent.tool_manager
+        registered = {tool.definition.func_name for tool in tool_manager.tools}
+        new_tools = []
+        for tool in tools:
+            if not isinstance(tool, FunctionTool):
+                tool = FunctionTool(fn=tool)
+            name = tool.definition.func_name
+            if name in registered:
+                warnings.warn(f"Tool {name} is already registered, skipping it.")
+                continue
+            registered.add(name)
+            new_tools.append(tool)
+        
+        if new_tools:
+            tool_manager.tools.extend(new_tools)
+            self._refresh_tool_definitions()
+    
+    def _refresh_tool_definitions(self) -> None:
+        """
+        Rebuild the ToolManager's dispatch table and the planner's tool
+        definitions after the tool list changed.
+        
+        Both are computed once in Agent.__init__, so a tool appended to the
+        ToolManager is neither callable nor visible to the planner until this
+        runs.
+        """
+        tool_manager = self.agent.tool_manager
+        tool_manager._context_map = tool_manager.create_context_map_from_tools(
+            tool_manager.tools
+        )
+        tool_manager.context = {
+            **tool_manager._context_map,
+            **tool_manager._additional_context,
+        }
+        self.agent.planner.prompt_kwargs["tools"] = tool_manager.yaml_definitions
     
 
 
@@ -0,0 +1,84 @@
+import pytest
+from adalflow.core.model_client import ModelClient
+from adalflow.core.types import Function
+
+from src.dummy_agent import DummyAgent
+
+
+def shout_tool(text: str) -> str:
+    """Return the text in upper case."""
+    return text.upper()
+
+
+def reverse_tool(text: str) -> str:
+    """Return the text reversed."""
+    return text[::-1]
+
+
+def _make_agent() -> DummyAgent:
+    return DummyAgent(model_client=ModelClient(), model_kwargs={"model": "dummy"})
+
+
+def _tool_names(agent: DummyAgent) -> list:
+    return [tool.definition.func_name for tool in agent.tools]
+
+
+def _execute(agent: DummyAgent, name: str, **kwargs):
+    return agent.agent.tool_manager.execute_func(Function(name=name, kwargs=kwargs))
+
+
+def test_default_tool_is_not_shared_between_agents():
+    first, second = _make_agent(), _make_agent()
+
+    assert first.tools[0] is not second.tools[0]
+
+
+def test_tool_added_after_construction_is_callable():
+    agent = _make_agent()
+    agent.add_tool(shout_tool)
+
+    assert "shout_tool" in str(agent.agent.tool_manager.yaml_definitions)
+    assert "shout_tool" in str(agent.agent.planner.prompt_kwargs["tools"])
+    assert agent.runner.tool_manager is agent.agent.tool_manager
+    assert _execute(agent, "shout_tool", text="hello").output == "HELLO"
+
+
+def test_register_tools_adds_every_tool():
+    agent = _make_agent()
+    agent.register_tools([shout_tool, reverse_tool])
+
+    definitions = str(agent.agent.tool_manager.yaml_definitions)
+    assert "shout_tool" in definitions
+    assert "reverse_tool" in definitions
+    assert _execute(agent, "shout_tool", text="hi").output == "HI"
+    assert _execute(agent, "reverse_tool", text="abc").output == "cba"
+    assert _execute(agent, "example_tool", query="hi").output == "Processed: hi"
+
+
+def test_add_tool_keeps_agent_and_runner_configuration():
+    agent = _make_agent()
+    inner_agent, runner = agent.agent, agent.runner
+    runner.ctx = {"user": "recruiter"}
+    inner_agent.train()
+
+    agent.add_tool(shout_tool)
+
+    assert agent.agent is inner_agent
+    assert agent.runner is runner
+    assert runner.ctx == {"user": "recruiter"}
+    assert inner_agent.training
+
+
+def test_register_tools_skips_registered_names():
+    agent = _make_agent()
+    agent.add_tool(shout_tool)
+
+    with pytest.warns(UserWarning) as record:
+        agent.register_tools([shout_tool, reverse_tool, reverse_tool])
+
+    skipped = [str(warning.message) for warning in record]
+    assert len(skipped) == 2
+    assert "shout_tool" in skipped[0] and "reverse_tool" in skipped[1]
+
+    assert _tool_names(agent) == ["example_tool", "shout_tool", "reverse_tool"]
+    assert str(agent.agent.planner.prompt_kwargs["tools"]).count("func_name: shout_tool") == 1